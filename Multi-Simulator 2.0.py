@@ -1,96 +1,129 @@
 import sys
 import os
-import geopandas as gpd
 import matplotlib.pyplot as plt
 from PyQt5 import uic, QtWidgets
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.animation import FuncAnimation
 from matplotlib.collections import LineCollection
+from matplotlib.patches import Rectangle
 import numpy as np
-from shapely.geometry import LineString
 from PyQt5.QtWidgets import QLabel
 from PyQt5.QtGui import QPixmap
+from result_cache import ResultCache
+from simulation import SCENARIOS, Release, first_hit_frames, load_region, trajectory
+
+VISIBLE_LENGTH = 30  # Number of segments to display
+
+
+def trail_templates(visible_length, min_linewidth=0.5, max_linewidth=1.5):
+    """
+    Fade and line width of a trail for every length up to visible_length, computed once.
+
+    Returns:
+        tuple: Lists indexed by the number of visible points, of alpha and line width arrays.
+    """
+    alphas, linewidths = [], []
+    for n in range(visible_length + 1):
+        # Create a gradient that fades to 0 at the tail
+        distances = np.linspace(0, 1, n)  # Scale from 0 to 1
+        alpha = np.exp(-((distances - 1) ** 2) * 10)  # Gaussian fade
+        alpha[alpha < 0.01] = 0  # Force very small values to 0
+        alphas.append(alpha)
+
+        # Gradually decrease line width from the head (max) to the tail (min)
+        linewidths.append(np.linspace(min_linewidth, max_linewidth, n))
+    return alphas, linewidths
+
+
+TRAIL_ALPHAS, TRAIL_LINEWIDTHS = trail_templates(VISIBLE_LENGTH)
+
 
 class AnimationManager:
-    def __init__(self, ax, x_data, y_data, color='blue', lw=1):
+    def __init__(self, ax, x_data, y_data, hit_frame, color='blue', lw=1, loop=True):
         self.ax = ax
         self.x_data = x_data
         self.y_data = y_data
+        self.hit_frame = hit_frame  # Frame at which the path reaches the shore, from first_hit_frames
+        self.loop = loop  # Replay forever, or play once and finish (seeded particles)
         self.line_collection = LineCollection([], cmap='Blues', lw=lw, linestyle='solid', capstyle='round' )
         self.ax.add_collection(self.line_collection)
-        self.animation = None
+        self.segments = None
+        self.frame_iter = None
+        self.frame = -1
+        self.frozen = False
+        self.finished = False
 
     def init(self):
         self.line_collection.set_segments([])
         self.line_collection.set_array(np.array([]))  # Reset alpha values
         return self.line_collection,
 
+    def frames(self):
+        # Frame counter owned by the manager, so a restart rewinds it instead of building a new FuncAnimation
+        while True:
+            self.frame += 1
+            if self.frame >= len(self.x_data):
+                self.frame = 0
+                self.init()
+                self.finished = not self.loop
+            yield self.frame
+
+    def restart(self):
+        self.init()
+        self.frame = -1
+        self.finished = not self.loop
+
+    def step(self):
+        # Advance one frame; called by the viewer's shared animation
+        return self.animate(next(self.frame_iter))
+
     def animate(self, frame):
-        visible_length = 30  # Number of segments to display
-        start_index = max(0, frame - visible_length)
+        start_index = max(0, frame - VISIBLE_LENGTH)
         end_index = frame
+        n_points = end_index - start_index
 
-        current_x = self.x_data[start_index:end_index]
-        current_y = self.y_data[start_index:end_index]
-
-        points = np.array([current_x, current_y]).T.reshape(-1, 1, 2)
-        segments = np.concatenate([points[:-1], points[1:]], axis=1)
+        # Sliding view on the precomputed segment buffer, no copies
+        segments = self.segments[start_index:start_index + max(n_points - 1, 0)]
 
-        if hasattr(self, 'frozen') and self.frozen:
+        if self.frozen:
             # Gradually fade the line if frozen
             current_alpha = self.line_collection.get_alpha()
             if current_alpha is None:  # Initialize alpha if not set
                 current_alpha = 1.0
             alpha = current_alpha - 0.02  # Decrease alpha gradually
-            if alpha <= 0:  # When fully faded, restart the animation
+            if alpha <= 0:  # When fully faded, restart the path
                 self.line_collection.set_segments([])  # Clear the line
                 self.line_collection.set_alpha(1)  # Reset alpha to fully visible
                 self.frozen = False
-                self.animation.event_source.stop()
-                self.start()
+                self.restart()
             else:
                 self.line_collection.set_alpha(alpha)
         else:
             self.line_collection.set_segments(segments)
 
-            # Check for intersections
-            if len(segments) > 0:  # Ensure segments exist
-                line_geom = gpd.GeoSeries([LineString(segments[-1])])  # Current segment as a LineString
-                if self.parent.shapefile['geometry'].intersects(line_geom.iloc[0]).any():
-                    self.frozen = True
-                    return self.line_collection,
-
-            if len(current_x) > 1:
-                # Create a gradient that fades to 0 at the tail
-                distances = np.linspace(0, 1, len(current_x))  # Scale from 0 to 1
-                alphas = np.exp(-((distances - 1) ** 2) * 10)  # Gaussian fade
-                alphas[alphas < 0.01] = 0  # Force very small values to 0
-                self.line_collection.set_array(alphas)
-
-                # Gradually decrease line width
-                max_linewidth = 1.5  # Maximum width at the head
-                min_linewidth = 0.5  # Minimum width at the tail
-                linewidths = np.linspace(min_linewidth, max_linewidth, len(current_x))
-                self.line_collection.set_linewidths(linewidths)
+            # Freeze once the path has reached the shore
+            if end_index >= self.hit_frame:
+                self.frozen = True
+                return self.line_collection,
+
+            if n_points > 1:
+                self.line_collection.set_array(TRAIL_ALPHAS[n_points])
+                self.line_collection.set_linewidths(TRAIL_LINEWIDTHS[n_points])
 
         # Reset animation when reaching the end of the data
         if frame >= len(self.x_data) - 1:
-            frame = 0  # Reset frame to start the animation again
             self.line_collection.set_segments([])  # Clear the previous line
             self.line_collection.set_alpha(1)  # Reset alpha to fully visible
 
         return self.line_collection,
 
     def start(self):
-        total_frames = int(len(self.x_data))
-        self.animation = FuncAnimation(
-            self.ax.figure,
-            self.animate,
-            init_func=self.init,
-            frames=total_frames,
-            interval=10,
-            blit=False
-        )
+        # Every segment of the path, built once; each frame only slices it
+        points = np.column_stack([self.x_data, self.y_data])
+        self.segments = np.stack([points[:-1], points[1:]], axis=1)
+        self.frame = -1
+        self.frame_iter = self.frames()
+        return self.init()
 
 class ShapefileViewer:
     def __init__(self, shapefile_path):
@@ -116,13 +149,20 @@ class ShapefileViewer:
         self.cid_move = self.fig.canvas.mpl_connect('motion_notify_event', self.onMove)
 
         self.red_dot = None
-        self.animations = []  # To store multiple animation objects
+        self.animations = []  # AnimationManagers driven by the shared animation
+        self.animation = None  # Single FuncAnimation stepping every manager
+
+        # Interactive seeding: flow used for particles released by double-click or shift+drag
+        self.seed_flow = None
+        self.seed_speed = 0.3
+        self.seed_direction = None
+        self.seed_rng = np.random.default_rng()
+        self.region_start = None
+        self.region_patch = None
 
     def plot_shapefile(self):
 
-        self.shapefile = gpd.read_file(self.shapefile_path)
-        self.shapefile['geometry'] = self.shapefile['geometry'].translate(xoff=-self.shapefile.total_bounds[2], yoff=-self.shapefile.total_bounds[3])
-        self.shapefile['geometry'] = self.shapefile['geometry'].scale(xfact=-1 /self.shapefile.total_bounds[0], yfact=-1 /self.shapefile.total_bounds[0], origin=(0, 0))
+        self.shapefile = load_region(self.shapefile_path)
 
         self.shapefile.plot(ax=self.ax, color='gray', edgecolor='black')
         self.ax.set_xticks([])
@@ -150,6 +190,13 @@ class ShapefileViewer:
         self.canvas.draw_idle()
 
     def onPress(self, event):
+        if event.button == 1 and event.key == 'shift':  # Shift + drag draws a seeding region
+            if event.xdata is not None and event.ydata is not None:
+                self.region_start = (event.xdata, event.ydata)
+                self.region_patch = Rectangle(self.region_start, 0, 0, fill=False, edgecolor='red', linestyle='--')
+                self.ax.add_patch(self.region_patch)
+            return
+
         if event.button == 1:  # Left mouse button
             self.dragging = True
             self.press_x = event.xdata
@@ -158,6 +205,7 @@ class ShapefileViewer:
         if event.dblclick:
             if event.xdata is not None and event.ydata is not None:
                 self.plot_red_dot(event.xdata, event.ydata)
+                self.seed_cloud(event.xdata, event.ydata)
 
     def plot_red_dot(self, x, y):
         if self.red_dot:
@@ -169,11 +217,25 @@ class ShapefileViewer:
         self.fig.canvas.draw_idle()
 
     def onRelease(self, event):
+        if self.region_start is not None:
+            self.region_patch.remove()
+            if event.xdata is not None and event.ydata is not None:
+                self.seed_region(self.region_start, (event.xdata, event.ydata))
+            self.region_start = None
+            self.region_patch = None
+            self.fig.canvas.draw_idle()
+
         self.dragging = False
         self.press_x = None
         self.press_y = None
 
     def onMove(self, event):
+        if self.region_start is not None and event.xdata is not None and event.ydata is not None:
+            self.region_patch.set_width(event.xdata - self.region_start[0])
+            self.region_patch.set_height(event.ydata - self.region_start[1])
+            self.canvas.draw_idle()
+            return
+
         if self.dragging and event.xdata is not None and event.ydata is not None:
             dx = self.press_x - event.xdata
             dy = self.press_y - event.ydata
@@ -189,37 +251,91 @@ class ShapefileViewer:
 
             self.canvas.draw_idle()
 
-    def start_multiple_animations(self, line_formula, start_coord, length=250, speed=float, direction=None):
+    def set_seed_flow(self, flow, speed, direction=None):
         """
-        Start animations based on a line formula and a starting coordinate.
+        Set the flow used for particles seeded interactively.
 
         Parameters:
-            line_formula (callable): A function that defines the line. It should take x as input and return y.
-            start_coord (tuple): Starting coordinate of the line (x, y).
-            length (int): Number of points to generate along the line.
+            flow (str): Name in simulation.FLOWS of a flow line taking (x, start_coord).
+            speed (float): Horizontal distance travelled by a seeded particle.
+            direction (str): "RtoL" or "LtoR", as in simulation.Release.
         """
-        if direction == "RtoL":
-            dir_factor = -1
-        else:
-            dir_factor = 1
-
+        self.seed_flow = flow
+        self.seed_speed = speed
+        self.seed_direction = direction
+
+    def seed_cloud(self, x, y, count=8, radius=0.01):
+        # Small particle cloud scattered around a double-clicked point
+        offsets = self.seed_rng.normal(scale=radius, size=(count, 2))
+        self.seed_particles(np.array([x, y]) + offsets)
+
+    def seed_region(self, corner_a, corner_b, count=12):
+        # Particles spread uniformly over a shift+drag rectangle
+        low = np.minimum(corner_a, corner_b)
+        high = np.maximum(corner_a, corner_b)
+        self.seed_particles(self.seed_rng.uniform(low, high, size=(count, 2)))
+
+    def seed_particles(self, starts):
+        """
+        Release new particles into the running simulation.
 
-        x_start, y_start = start_coord
+        Only the new trajectories are computed, and all of them are checked against the cached
+        coastline index in one query; they play once alongside the running animations.
+        """
+        if self.seed_flow is None or not hasattr(self, 'shapefile'):
+            return
 
-        # Generate x values dynamically
-        x_values = np.linspace(x_start, x_start + (dir_factor * speed), length)  # speed and direction here
-        y_values = np.array([line_formula(x) for x in x_values])
+        releases = [Release(self.seed_flow, (start,), start, self.seed_speed, self.seed_direction)
+                    for start in map(tuple, starts)]
+        paths = np.stack([trajectory(release) for release in releases])
+        hit_frames = first_hit_frames(self.shapefile, paths)
+        for path, hit_frame in zip(paths, hit_frames):
+            self.start_path(path[:, 0], path[:, 1], int(hit_frame), loop=False)
 
-        # Animation paths
-        path = (x_values, y_values)
+    def start_path(self, x_values, y_values, hit_frame=None, loop=True):
+        """
+        Add an already computed path to the shared animation.
 
-        # Start animation
-        anim_manager = AnimationManager(self.ax, path[0], path[1], color='blue')
-        anim_manager.parent = self  # Attach ShapefileViewer to AnimationManager
+        Parameters:
+            x_values, y_values (np.ndarray): Points of the path.
+            hit_frame (int): Frame at which the path reaches the shore; computed here with
+                first_hit_frames when not given, never checked frame by frame.
+            loop (bool): Replay the path forever, or remove it once it has played.
+        """
+        if hit_frame is None:
+            path = np.column_stack([x_values, y_values])
+            hit_frame = int(first_hit_frames(self.shapefile, path[np.newaxis])[0])
+        anim_manager = AnimationManager(self.ax, x_values, y_values, hit_frame, color='blue', loop=loop)
         anim_manager.start()
         self.animations.append(anim_manager)
 
-        self.canvas.draw()
+        if self.animation is None:
+            # One timer and one redraw per tick for every path, however many are added later
+            self.animation = FuncAnimation(
+                self.fig,
+                self.animate,
+                init_func=self.init_animation,
+                interval=10,
+                blit=False,
+                cache_frame_data=False
+            )
+
+        self.canvas.draw_idle()
+
+    def init_animation(self):
+        return [manager.line_collection for manager in self.animations]
+
+    def animate(self, frame):
+        artists = []
+        for manager in self.animations:
+            artists.extend(manager.step())
+
+        # Seeded particles that have played once leave the plot and the list
+        for manager in self.animations:
+            if manager.finished:
+                manager.line_collection.remove()
+        self.animations = [manager for manager in self.animations if not manager.finished]
+        return artists
 
 
 class Ui(QtWidgets.QMainWindow):
@@ -235,6 +351,7 @@ class Ui(QtWidgets.QMainWindow):
         self.WindRose_Daytime_Layout = self.findChild(QtWidgets.QVBoxLayout, 'WindRose_Daytime_Layout')
         self.WindRose_Label = self.findChild(QtWidgets.QLabel, 'Windrose_Label')
         self.WindRose_Daytime_Label = self.findChild(QtWidgets.QLabel, 'Windrose_Daytime_Label')
+        self.result_cache = ResultCache()
 
         self.show()
 
@@ -255,156 +372,29 @@ class Ui(QtWidgets.QMainWindow):
         layout.addWidget(image_label)
 
 
-    # Summer in Northern Howe Sound
-    def North_Fan_Line(self, x, Dir):
-        return 0.5 * (Dir *(x+ 0.18) * (x + 0.18) -0.3) + 0.5 * ((x + 0.18) -0.3)
-
-    def Central_Fan_Line(self, x, Dir, V_Offset):
-        return 0.4 * (Dir * (x + 0.18) * (x + 0.18) ) + 0.2 * ((x + 0.18) - 0.3) - V_Offset
-    def Central_Fan_Line2(self, x, Dir):
-        return 0.4 * (Dir * (x + 0.18) * (x + 0.18) ) + 0.2 * ((x + 0.18) - 0.3) -0.22
-
-
-    #Two most frequent daytime wind direction is 155 and 165
-    def North_Summer(self,x,start_coor):
-        return  -2.75 * (x - (start_coor[0])) + start_coor[1]
-
-
-    # Winter in Northern Howe Sound
-    #Two most frequent daytime wind direction is 335 and 355
-    #Slope = tan(75) = 3.73
-    def North_Winter(self,x,start_coor):
-        return  -3.73 * (x - (start_coor[0])) + start_coor[1]
-
-
-    #Summer in Central Howe Sound
-    #Two most frequent daytime wind direction is 135 and 145
-    #Slope = tan(50) = 1.19
-    def central_summer_1(self,x, start_coor): #Wind Direction Flow
-        return -1.19 * (x - (start_coor[0])) + start_coor[1]
-    def central_summer_2(self,x, start_coor): #Upstream Flow
-        return 1 * (x - (start_coor[0])) + start_coor[1]
-
-    #Winter in Central Howe Sound
-    #Two most frequent daytime wind direction is 345 and 355
-    #Slope = tan(80) = 5.67
-    def central_winter_1(self,x, start_coor): #Wind Direction Flow
-        return -5.67 * (x - (start_coor[0])) + start_coor[1]
-
-
-
-
-    #Summer in Southern Howe Sound, Two most frequent daytime wind direction is 275 and 285
-    #Winter in Southern Howe Sound, Two most frequent daytime wind direction is 95 and 105
-    #Both Slope = tan(10) = 0.176
-    #Summer Westerlies, Winter Easterlies
-    def Southern_Wind(self,x, start_coor): #Wind Direction Flow
-        return -0.176 * (x - (start_coor[0])) + start_coor[1]
-
-
-
-
-
     def plot_shapefile_in_layout(self):
         while self.layout.count():
             child = self.layout.takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
 
-        if self.location_ComboBox.currentText() == "Northern Howe Sound":
-
-            self.viewer = ShapefileViewer('Howe_Sound_Shapefile_Splited/Northern_Howe_Sound.shp')
-
-            if self.Season_ComboBox.currentText() == "Summer":
-                self.Add_Windrose(image_path="Wind_Rose/North Summer.png",layout=self.WindRose_layout)
-                self.WindRose_Label.setText("Northern Howe Sound Summer")
-                self.Add_Windrose(image_path="Wind_Rose/North Summer Daytime.png",layout=self.WindRose_Daytime_Layout)
-                self.WindRose_Daytime_Label.setText("Northern Howe Sound Summer Daytime")
-
-
-
-                Fan_Shape_Factor = [10, 1.3, 0.6,-0.27]
-
+        # Flow lines and starting coordinates of each location/season live in simulation.SCENARIOS
+        scenario = SCENARIOS[(self.location_ComboBox.currentText(), self.Season_ComboBox.currentText())]
 
+        self.viewer = ShapefileViewer(scenario.shapefile)
 
-                for i in Fan_Shape_Factor:
-                    self.viewer.start_multiple_animations(lambda x: self.North_Fan_Line(x, i), (-0.18, -0.3), speed=0.8,
-                                                          direction="RtoL")
-                self.viewer.start_multiple_animations(lambda x: self.North_Summer(x, (-0.8, -1.6)), (-0.8, -1.6), speed=0.4,direction="RtoL")
-                self.viewer.start_multiple_animations(lambda x: self.North_Summer(x, (-0.66, -1.46)), (-0.66, -1.46), speed=0.4,direction="RtoL")
+        self.Add_Windrose(image_path=scenario.wind_rose, layout=self.WindRose_layout)
+        self.WindRose_Label.setText(scenario.label)
+        self.Add_Windrose(image_path=scenario.wind_rose_daytime, layout=self.WindRose_Daytime_Layout)
+        self.WindRose_Daytime_Label.setText(f"{scenario.label} Daytime")
 
+        # Trajectories and shore hits come from the result cache, computed only when the scenario changed
+        result = self.result_cache.run_scenario(scenario)
+        for path, hit_frame in zip(result['paths'], result['hit_frames']):
+            self.viewer.start_path(path[:, 0], path[:, 1], int(hit_frame))
 
-
-            else:   #Northern Winter
-                self.Add_Windrose(image_path="Wind_Rose/North Winter.png",layout=self.WindRose_layout)
-                self.WindRose_Label.setText("Northern Howe Sound Winter")
-                self.Add_Windrose(image_path="Wind_Rose/North Winter Daytime.png",layout=self.WindRose_Daytime_Layout)
-                self.WindRose_Daytime_Label.setText("Northern Howe Sound Winter Daytime")
-                Starting_Coord_Northern_Winter = [(-0.238, -0.3), (-0.44, -0.35), (-0.565, -0.43),(-0.73, -1.18), (-0.62, -0.95), (-0.544, -0.91)]
-
-                for i in Starting_Coord_Northern_Winter:
-                    self.viewer.start_multiple_animations(lambda x: self.North_Winter(x, i), i, speed=0.15, direction="LtoR")
-
-
-        elif self.location_ComboBox.currentText() == "Central Howe Sound":
-            self.viewer = ShapefileViewer('Howe_Sound_Shapefile_Splited/Central_Howe_Sound.shp')
-
-            if self.Season_ComboBox.currentText() == "Summer":
-                self.Add_Windrose(image_path="Wind_Rose/Central Summer.png",layout=self.WindRose_layout)
-                self.WindRose_Label.setText("Central Howe Sound Summer")
-                self.Add_Windrose(image_path="Wind_Rose/Central Summer Daytime.png",layout=self.WindRose_Daytime_Layout)
-                self.WindRose_Daytime_Label.setText("Central Howe Sound Summer Daytime")
-
-                Starting_Coord_Central_Summer = [(-0.45, -0.31), (-0.178, -0.5) ,(-0.21, -0.7), (-0.124, -0.49), (-0.31, -0.65), (-0.292, -0.94), (-0.35, -1),
-                                                 (-0.67, -0.955), (-0.56, -0.91), (-0.54, -0.86), (-0.064, -1.04), (-0.855, -0.69), (-0.85, -0.54), (-0.598, -0.31), (-0.785, -0.797),
-                                                 (-0.04, -0.9), (-0.07, -0.74)]
-
-                for i in Starting_Coord_Central_Summer:
-                    self.viewer.start_multiple_animations(lambda x: self.central_summer_1(x, i), i, speed=0.4, direction="RtoL")
-                self.viewer.start_multiple_animations(lambda x: self.central_summer_2(x, (-0.16,-0.24)),(-0.16,-0.24), speed=0.3, direction= "RtoL")
-                self.viewer.start_multiple_animations(lambda x: self.central_summer_2(x, (-0.11,-0.26)),(-0.11,-0.26), speed=0.3, direction= "RtoL")
-
-                self.viewer.start_multiple_animations(lambda x: self.Central_Fan_Line(x, 14, V_Offset=0), (-0.07, 0.037), speed=0.35,direction="RtoL")
-                self.viewer.start_multiple_animations(lambda x: self.Central_Fan_Line(x, 14, V_Offset=0.245), (-0.07, 0.037), speed=0.35,direction="RtoL")
-                self.viewer.start_multiple_animations(lambda x: self.Central_Fan_Line(x, 14, V_Offset=0.292), (-0.07, 0.037), speed=0.35,direction="RtoL")
-                self.viewer.start_multiple_animations(lambda x: self.Central_Fan_Line(x, 14, V_Offset=0.14), (-0.07, 0.037), speed=0.35,direction="RtoL")
-
-
-
-            else: #Central Winter
-                self.Add_Windrose(image_path="Wind_Rose/Central Winter.png",layout=self.WindRose_layout)
-                self.WindRose_Label.setText("Central Howe Sound Winter")
-                self.Add_Windrose(image_path="Wind_Rose/Central Winter Daytime.png",layout=self.WindRose_Daytime_Layout)
-                self.WindRose_Daytime_Label.setText("Central Howe Sound Winter Daytime")
-                Starting_Coord_Central_Winter = [(-0.035, -0.002), (-0.0853, -0.482), (-0.046, -0.68), (-0.074, -0.977), (-0.45, -0.9), (-0.74, -0.94),
-                                                 (-0.689, -0.78), (-0.609, -0.776), (-0.2, -0.71), (-0.905, -0.334), (-0.422, -0.32), (-0.86, -0.49), (-0.83, -0.72)]
-                for i in Starting_Coord_Central_Winter:
-                    self.viewer.start_multiple_animations(lambda x: self.central_winter_1(x, i), i, speed=0.1, direction="LtoR")
-                self.viewer.start_multiple_animations(lambda x: self.central_summer_2(x, (-0.16, -0.24)),(-0.16, -0.24), speed=0.3, direction="RtoL")
-                self.viewer.start_multiple_animations(lambda x: self.central_summer_2(x, (-0.11, -0.26)),(-0.11, -0.26), speed=0.3, direction="RtoL")
-
-
-
-        else:
-            self.viewer = ShapefileViewer('Howe_Sound_Shapefile_Splited/Southern_Howe_Sound.shp')
-
-            if self.Season_ComboBox.currentText() == "Summer":
-                self.Add_Windrose(image_path="Wind_Rose/South Summer.png", layout=self.WindRose_layout)
-                self.WindRose_Label.setText("South Howe Sound Summer")
-                self.Add_Windrose(image_path="Wind_Rose/South Summer Daytime.png",layout=self.WindRose_Daytime_Layout)
-                self.WindRose_Daytime_Label.setText("South Howe Sound Summer Daytime")
-                Starting_Coord_South_Summer = [(-0.85, -0.186),(-0.82, -0.12),(-0.67, -0.355) , (-0.268, -0.392), (-0.24, -0.225), (-0.66, -0.093)]
-                for i in Starting_Coord_South_Summer:
-                    self.viewer.start_multiple_animations(lambda x: self.Southern_Wind(x, i), i, speed=0.3, direction="LtoR")
-
-            else:
-                self.Add_Windrose(image_path="Wind_Rose/South Winter.png", layout=self.WindRose_layout)
-                self.WindRose_Label.setText("South Howe Sound Winter")
-                self.Add_Windrose(image_path="Wind_Rose/South Winter Daytime.png",layout=self.WindRose_Daytime_Layout)
-                self.WindRose_Daytime_Label.setText("South Howe Sound Winter Daytime")
-                Starting_Coord_South_Winter = [(-0.05, -0.145),(-0.145, -0.277) , (-0.178, -0.468), (-0.56, -0.372), (-0.43, -0.124) , (-0.719, -0.328)]
-                for i in Starting_Coord_South_Winter:
-                    self.viewer.start_multiple_animations(lambda x: self.Southern_Wind(x, i), i, speed=0.3,direction="RtoL")
+        seed_flow, seed_speed, seed_direction = scenario.seed
+        self.viewer.set_seed_flow(seed_flow, speed=seed_speed, direction=seed_direction)
 
         self.viewer.plot_shapefile()
         self.layout.addWidget(self.viewer.canvas)
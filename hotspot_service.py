@@ -0,0 +1,214 @@
+"""
+Local HTTP service for scenario runs and hotspot maps, no PyQt5 window needed.
+
+Endpoints (GET, location and season as in the simulator's combo boxes):
+    /scenarios                                   Available location/season pairs
+    /scenario?location=..&season=..              Trajectories, shore hits and stranding points as JSON
+    /hotspots?location=..&season=..              Hotspot density grid as JSON
+    /tile.png?location=..&season=..&z=..&x=..&y=..  Hotspot density tile as PNG, tile y=0 at the top
+
+Responses are kept in an in-memory LRU cache; misses run in a process pool (backed by the
+on-disk result cache) and identical concurrent requests share the same computation.
+"""
+import argparse
+import io
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import matplotlib
+import matplotlib.image
+import numpy as np
+
+from result_cache import ResultCache
+from simulation import SCENARIOS, load_region
+
+TILE_SIZE = 256  # Tile width and height in pixels
+TILE_CELLS = 32  # Density cells across one tile
+MAX_ZOOM = 6
+RESPONSE_CACHE_SIZE = 512  # Responses kept in memory
+
+
+def _scenario_result(location, season):
+    scenario = SCENARIOS[(location, season)]
+    return ResultCache().run_scenario(scenario), load_region(scenario.shapefile).total_bounds
+
+
+def scenario_json(location, season):
+    result, bounds = _scenario_result(location, season)
+    return json.dumps({
+        'location': location,
+        'season': season,
+        'bounds': bounds.tolist(),
+        'paths': result['paths'].tolist(),
+        'hit_frames': result['hit_frames'].tolist(),
+        'strandings': result['strandings'].tolist(),
+    }).encode()
+
+
+def hotspots_json(location, season):
+    result, bounds = _scenario_result(location, season)
+    return json.dumps({
+        'location': location,
+        'season': season,
+        'bounds': bounds.tolist(),
+        'hotspots': result['hotspots'].tolist(),  # Rows run from the southern to the northern edge
+    }).encode()
+
+
+@lru_cache(maxsize=32)
+def _zoom_cells(location, season, z):
+    # Cell (column, row) of every stranding point at one zoom, rows south to north, and the
+    # busiest cell's count. Only the few occupied cells are kept, never the region-wide grid.
+    result, bounds = _scenario_result(location, season)
+    minx, miny, maxx, maxy = bounds
+    n_cells = 2 ** z * TILE_CELLS
+    points = result['strandings']
+    inside = ((points[:, 0] >= minx) & (points[:, 0] <= maxx) &
+              (points[:, 1] >= miny) & (points[:, 1] <= maxy))
+    scaled = (points[inside] - [minx, miny]) / [maxx - minx, maxy - miny] * n_cells
+    cells = np.minimum(scaled.astype(np.int64), n_cells - 1)  # Points on the far edge go in the last cell
+    counts = np.unique(cells, axis=0, return_counts=True)[1]
+    return cells, max(counts.max(initial=0), 1)
+
+
+def tile_png(location, season, z, x, y):
+    """
+    Render one hotspot density tile.
+
+    The region bounds are split into 2**z by 2**z tiles; colours are scaled to the busiest
+    cell of the whole region at this zoom so neighbouring tiles match.
+    """
+    tiles = 2 ** z
+    cells, vmax = _zoom_cells(location, season, z)
+
+    # Cell rows run south to north, tile rows north to south
+    local = cells - [x * TILE_CELLS, (tiles - 1 - y) * TILE_CELLS]
+    local = local[((local >= 0) & (local < TILE_CELLS)).all(axis=1)]
+    counts = np.bincount(local[:, 1] * TILE_CELLS + local[:, 0], minlength=TILE_CELLS * TILE_CELLS)
+    tile = counts.reshape(TILE_CELLS, TILE_CELLS)[::-1]
+
+    rgba = matplotlib.colormaps['YlOrRd'](tile / vmax)
+    rgba[tile == 0, 3] = 0  # Transparent where nothing stranded
+    scale = TILE_SIZE // TILE_CELLS
+    rgba = np.repeat(np.repeat(rgba, scale, axis=0), scale, axis=1)
+
+    buffer = io.BytesIO()
+    matplotlib.image.imsave(buffer, rgba, format='png')
+    return buffer.getvalue()
+
+
+class HotspotService:
+    def __init__(self, workers=None, cache_size=RESPONSE_CACHE_SIZE):
+        """
+        Parameters:
+            workers (int): Processes computing cache misses, defaults to the CPU count.
+            cache_size (int): Number of responses kept in the in-memory LRU cache.
+        """
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.inflight = {}  # Key -> Future of a computation already running
+        self.lock = threading.RLock()  # Reentrant: done callbacks may run while it is held
+
+    def fetch(self, key, func, *args):
+        """Return func(*args) from the LRU cache, an identical running request, or the process pool."""
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+            future = self.inflight.get(key)
+            if future is None:
+                future = self.pool.submit(func, *args)
+                self.inflight[key] = future
+                future.add_done_callback(lambda done, key=key: self._finish(key, done))
+        return future.result()
+
+    def _finish(self, key, future):
+        with self.lock:
+            self.inflight.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            self.cache[key] = future.result()
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def shutdown(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+class HotspotRequestHandler(BaseHTTPRequestHandler):
+    service = None  # HotspotService shared by all request threads
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+
+        if url.path == '/scenarios':
+            scenarios = [{'location': location, 'season': season, 'label': scenario.label,
+                          'releases': len(scenario.releases)}
+                         for (location, season), scenario in SCENARIOS.items()]
+            return self.send_body(json.dumps(scenarios).encode(), 'application/json')
+
+        if url.path not in ('/scenario', '/hotspots', '/tile.png'):
+            return self.send_error(404, "Unknown endpoint")
+
+        location, season = query.get('location'), query.get('season')
+        if (location, season) not in SCENARIOS:
+            return self.send_error(400, "Unknown location/season")
+
+        if url.path == '/scenario':
+            return self.send_result('application/json', ('scenario', location, season), scenario_json, location, season)
+
+        if url.path == '/hotspots':
+            return self.send_result('application/json', ('hotspots', location, season), hotspots_json, location, season)
+
+        try:
+            z, x, y = int(query['z']), int(query['x']), int(query['y'])
+        except (KeyError, ValueError):
+            return self.send_error(400, "Tile needs integer z, x and y")
+        if not (0 <= z <= MAX_ZOOM and 0 <= x < 2 ** z and 0 <= y < 2 ** z):
+            return self.send_error(400, "Tile out of range")
+
+        return self.send_result('image/png', ('tile', location, season, z, x, y), tile_png, location, season, z, x, y)
+
+    def send_result(self, content_type, key, func, *args):
+        # Worker failures (missing data files, a broken pool) still get an HTTP answer
+        try:
+            body = self.service.fetch(key, func, *args)
+        except Exception as error:
+            self.log_error("%s failed: %r", key, error)
+            return self.send_error(500, "Scenario computation failed", f"{type(error).__name__}: {error}")
+        return self.send_body(body, content_type)
+
+    def send_body(self, body, content_type):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Serve Howe Sound debris hotspots on localhost.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8050)
+    parser.add_argument('--workers', type=int, default=None, help="Processes for cache misses")
+    parser.add_argument('--cache-size', type=int, default=RESPONSE_CACHE_SIZE, help="Responses kept in memory")
+    args = parser.parse_args()
+
+    HotspotRequestHandler.service = HotspotService(workers=args.workers, cache_size=args.cache_size)
+    server = ThreadingHTTPServer((args.host, args.port), HotspotRequestHandler)
+    print(f"Serving hotspots on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        HotspotRequestHandler.service.shutdown()
@@ -0,0 +1,150 @@
+"""
+Content-addressed result cache for scenario runs.
+
+Entries are keyed by a hash of the shapefile content, the release parameters, the path length
+and the engine source code, and stored on disk as .npz files. Every release is cached on its
+own, so a sweep that changes a few starting points only recomputes those paths. Least recently
+used entries are evicted once the cache grows past its size budget.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from functools import lru_cache
+
+import numpy as np
+
+import simulation
+from simulation import HOTSPOT_BINS, PATH_LENGTH, first_hit_frames, load_region, scenario_result, trajectory
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.hotspot_cache')
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+SHAPEFILE_PARTS = ('.shp', '.shx', '.dbf', '.prj', '.cpg')
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path, mtime_ns, size):
+    # mtime and size are only part of the lru key, so an edited file is hashed again
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def shapefile_digest(shapefile_path):
+    """Hash of the shapefile and the sidecar files that change its geometry or attributes."""
+    stem = os.path.splitext(shapefile_path)[0]
+    digest = hashlib.sha256()
+    for suffix in SHAPEFILE_PARTS:
+        path = stem + suffix
+        if os.path.exists(path):
+            stat = os.stat(path)
+            digest.update(suffix.encode() + _file_digest(path, stat.st_mtime_ns, stat.st_size).encode())
+    return digest.hexdigest()
+
+
+def code_version():
+    """Hash of the engine source, so cached results are dropped whenever the simulation changes."""
+    stat = os.stat(simulation.__file__)
+    return _file_digest(simulation.__file__, stat.st_mtime_ns, stat.st_size)
+
+
+class ResultCache:
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+        """
+        Parameters:
+            directory (str): Folder holding the cached .npz entries.
+            max_bytes (int): Size budget of the folder before least recently used entries are removed.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(*parts):
+        # JSON turns the release namedtuples into plain lists, giving a stable text to hash
+        return hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    def get(self, key):
+        """Return the cached arrays for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError, EOFError, zipfile.BadZipFile):  # Missing, evicted meanwhile or truncated entry
+            return None
+        return arrays
+
+    def put(self, key, arrays):
+        """Store arrays under key; call evict() once a batch of puts is done."""
+        # Write to a temporary file first so concurrent readers never see half an entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.npz'):
+                try:
+                    stat = entry.stat()
+                except OSError:  # Removed by another process while scanning
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:  # Already removed by another process
+                pass
+            total -= size
+
+    def run_scenario(self, scenario, length=PATH_LENGTH, bins=HOTSPOT_BINS):
+        """
+        Cached equivalent of simulation.run_scenario.
+
+        Identical scenarios come straight from disk; otherwise only the releases without a
+        cached path are computed, in a single collision query.
+        """
+        shape_key = shapefile_digest(scenario.shapefile)
+        version = code_version()
+
+        scenario_key = self.key('scenario', shape_key, scenario.releases, length, bins, version)
+        result = self.get(scenario_key)
+        if result is not None:
+            return result
+
+        release_keys = [self.key('release', shape_key, release, length, version) for release in scenario.releases]
+        cached = [self.get(key) for key in release_keys]
+        missing = [i for i, entry in enumerate(cached) if entry is None]
+
+        shapefile = load_region(scenario.shapefile)
+        if missing:
+            paths = np.stack([trajectory(scenario.releases[i], length) for i in missing])
+            hit_frames = first_hit_frames(shapefile, paths)
+            for i, path, hit_frame in zip(missing, paths, hit_frames):
+                cached[i] = {'path': path, 'hit_frame': np.asarray(hit_frame)}
+                self.put(release_keys[i], cached[i])
+
+        paths = np.stack([entry['path'] for entry in cached])
+        hit_frames = np.array([int(entry['hit_frame']) for entry in cached])
+        result = scenario_result(shapefile, paths, hit_frames, bins)
+        self.put(scenario_key, result)
+        self.evict()  # Once per run, after this run's entries are all written
+        return result
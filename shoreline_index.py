@@ -0,0 +1,150 @@
+"""
+Shoreline segment index and beach-level hotspot ranking.
+
+Each regional coastline is cut into fixed-length shoreline segments by linear referencing
+(distance along each coastline line), and stranding points are snapped to their nearest
+segment in one vectorized query. Run as a script to print the ranked beaches of every scenario.
+"""
+import argparse
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import shapely
+
+from result_cache import ResultCache
+from simulation import SCENARIOS, load_region
+
+SEGMENT_LENGTH = 0.02  # Shoreline segment length in normalised map units
+
+
+class ShorelineIndex:
+    def __init__(self, region, shapefile, segment_length=SEGMENT_LENGTH):
+        """
+        Split the coastline of one region into fixed-length segments.
+
+        Parameters:
+            region (str): Region name used as prefix of the segment IDs.
+            shapefile (GeoDataFrame): Region from simulation.load_region.
+            segment_length (float): Length of a shoreline segment along the boundary.
+        """
+        self.region = region
+        self.segment_length = segment_length
+
+        # The regional shapefiles are coastline LineStrings; polygon layers contribute their boundary rings
+        geometries = np.asarray(shapefile.geometry)
+        polygonal = np.isin(shapely.get_type_id(geometries), [3, 6])  # Polygon, MultiPolygon
+        geometries = np.where(polygonal, shapely.boundary(geometries), geometries)
+        # Densify so no edge spans more than one segment
+        lines = shapely.segmentize(shapely.get_parts(geometries), segment_length / 2)
+        coords, line_idx = shapely.get_coordinates(lines, return_index=True)
+
+        # Vertex-to-vertex coastline edges, never bridging two lines
+        same_line = line_idx[:-1] == line_idx[1:]
+        edge_start = coords[:-1][same_line]
+        edge_end = coords[1:][same_line]
+        edge_line = line_idx[:-1][same_line]
+        if len(edge_line) == 0:
+            raise ValueError(f"No coastline edges found in {region}")
+        edge_length = np.hypot(*(edge_end - edge_start).T)
+
+        # Linear referencing: chainage of each edge midpoint along its own line
+        distance_before = np.cumsum(edge_length) - edge_length
+        line_first_edge = np.searchsorted(edge_line, edge_line)
+        chainage = distance_before - distance_before[line_first_edge] + edge_length / 2
+        segment_no = (chainage // segment_length).astype(int)
+
+        segment_keys, self.edge_segment = np.unique(np.column_stack([edge_line, segment_no]), axis=0,
+                                                    return_inverse=True)
+        self.edge_segment = self.edge_segment.ravel()
+        self.edge_tree = shapely.STRtree(shapely.linestrings(np.stack([edge_start, edge_end], axis=1)))
+
+        # Segment table: chainage range and length-weighted centre for locating the beach
+        n_segments = len(segment_keys)
+        weight = np.bincount(self.edge_segment, weights=edge_length, minlength=n_segments)
+        weight[weight == 0] = 1  # Degenerate segments made of repeated vertices
+        midpoints = (edge_start + edge_end) / 2
+        self.segments = pd.DataFrame({
+            'segment_id': [f"{region}-{line:03d}-{seg:04d}" for line, seg in segment_keys],
+            'line': segment_keys[:, 0],
+            'chainage_start': segment_keys[:, 1] * segment_length,
+            'chainage_end': (segment_keys[:, 1] + 1) * segment_length,
+            'x': np.bincount(self.edge_segment, weights=edge_length * midpoints[:, 0], minlength=n_segments) / weight,
+            'y': np.bincount(self.edge_segment, weights=edge_length * midpoints[:, 1], minlength=n_segments) / weight,
+        })
+
+    def snap(self, points):
+        """
+        Snap stranding points to their nearest shoreline segment.
+
+        Parameters:
+            points (array-like): (n, 2) x, y points in the region's map coordinates.
+
+        Returns:
+            np.ndarray: Row of self.segments for every point.
+        """
+        points = shapely.points(np.asarray(points, dtype=float).reshape(-1, 2))
+        point_idx, edge_idx = self.edge_tree.query_nearest(points, all_matches=False)
+        if len(point_idx) != len(points) or np.any(np.bincount(point_idx, minlength=len(points)) != 1):
+            raise ValueError(f"Could not snap every point to the {self.region} shoreline")
+        segment_rows = np.full(len(points), -1, dtype=int)
+        segment_rows[point_idx] = self.edge_segment[edge_idx]
+        return segment_rows
+
+
+@lru_cache(maxsize=None)
+def shoreline_index(shapefile_path, segment_length=SEGMENT_LENGTH):
+    # Built once per region and segment length
+    region = os.path.splitext(os.path.basename(shapefile_path))[0]
+    return ShorelineIndex(region, load_region(shapefile_path), segment_length)
+
+
+def rank_beaches(index, events_by_scenario):
+    """
+    Rank the shoreline segments of one region by stranding hits.
+
+    Parameters:
+        index (ShorelineIndex): Segment index of the region.
+        events_by_scenario (dict): Scenario name -> (n, 2) array of stranding points.
+
+    Returns:
+        DataFrame: Segments with at least one hit, one count column per scenario plus 'total',
+        sorted with the most hit beach first.
+    """
+    table = index.segments.copy()
+    table.insert(0, 'region', index.region)
+    for name, points in events_by_scenario.items():
+        table[name] = np.bincount(index.snap(points), minlength=len(table))
+        if table[name].sum() != len(points):
+            raise ValueError(f"{name}: {table[name].sum()} beach hits for {len(points)} strandings")
+    table['total'] = table[list(events_by_scenario)].sum(axis=1)
+    table = table[table['total'] > 0]
+    return table.sort_values('total', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def scenario_hotspots(segment_length=SEGMENT_LENGTH):
+    """
+    Run every scenario through the result cache and rank the beaches of each region,
+    one count column per season.
+    """
+    cache = ResultCache()
+    tables = []
+    for shapefile_path in sorted({scenario.shapefile for scenario in SCENARIOS.values()}):
+        events = {season: cache.run_scenario(scenario)['strandings']
+                  for (location, season), scenario in SCENARIOS.items() if scenario.shapefile == shapefile_path}
+        tables.append(rank_beaches(shoreline_index(shapefile_path, segment_length), events))
+    return pd.concat(tables, ignore_index=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Rank Howe Sound beaches by simulated debris stranding.")
+    parser.add_argument('--segment-length', type=float, default=SEGMENT_LENGTH,
+                        help="Shoreline segment length in normalised map units")
+    parser.add_argument('--csv', help="Also write the ranking to this CSV file")
+    args = parser.parse_args()
+
+    ranking = scenario_hotspots(args.segment_length)
+    print(ranking.to_string(index=False))
+    if args.csv:
+        ranking.to_csv(args.csv, index=False)
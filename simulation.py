@@ -0,0 +1,247 @@
+"""
+Headless debris trajectory engine for the Howe Sound simulator.
+
+Holds the regional flow lines, the release points of every location/season scenario
+and the coastline collision test, so scenarios can be run without the PyQt5 window.
+"""
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+import geopandas as gpd
+import numpy as np
+import shapely
+
+# Next to this module, so headless runs work from any working directory
+SHAPEFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Howe_Sound_Shapefile_Splited')
+PATH_LENGTH = 250  # Number of points generated along each trajectory
+HOTSPOT_BINS = 64  # Hotspot grid resolution over the region bounds
+
+# A single debris release: flow line name and its extra arguments, start point, travel distance and direction
+Release = namedtuple('Release', ['flow', 'args', 'start', 'speed', 'direction'])
+
+# Everything the viewer needs for one location/season; seed is the (flow, speed, direction) used for click seeding
+Scenario = namedtuple('Scenario', ['shapefile', 'label', 'wind_rose', 'wind_rose_daytime', 'releases', 'seed'])
+
+
+# Summer in Northern Howe Sound
+def North_Fan_Line(x, Dir):
+    return 0.5 * (Dir *(x+ 0.18) * (x + 0.18) -0.3) + 0.5 * ((x + 0.18) -0.3)
+
+def Central_Fan_Line(x, Dir, V_Offset):
+    return 0.4 * (Dir * (x + 0.18) * (x + 0.18) ) + 0.2 * ((x + 0.18) - 0.3) - V_Offset
+def Central_Fan_Line2(x, Dir):
+    return 0.4 * (Dir * (x + 0.18) * (x + 0.18) ) + 0.2 * ((x + 0.18) - 0.3) -0.22
+
+
+#Two most frequent daytime wind direction is 155 and 165
+def North_Summer(x,start_coor):
+    return  -2.75 * (x - (start_coor[0])) + start_coor[1]
+
+
+# Winter in Northern Howe Sound
+#Two most frequent daytime wind direction is 335 and 355
+#Slope = tan(75) = 3.73
+def North_Winter(x,start_coor):
+    return  -3.73 * (x - (start_coor[0])) + start_coor[1]
+
+
+#Summer in Central Howe Sound
+#Two most frequent daytime wind direction is 135 and 145
+#Slope = tan(50) = 1.19
+def central_summer_1(x, start_coor): #Wind Direction Flow
+    return -1.19 * (x - (start_coor[0])) + start_coor[1]
+def central_summer_2(x, start_coor): #Upstream Flow
+    return 1 * (x - (start_coor[0])) + start_coor[1]
+
+#Winter in Central Howe Sound
+#Two most frequent daytime wind direction is 345 and 355
+#Slope = tan(80) = 5.67
+def central_winter_1(x, start_coor): #Wind Direction Flow
+    return -5.67 * (x - (start_coor[0])) + start_coor[1]
+
+
+#Summer in Southern Howe Sound, Two most frequent daytime wind direction is 275 and 285
+#Winter in Southern Howe Sound, Two most frequent daytime wind direction is 95 and 105
+#Both Slope = tan(10) = 0.176
+#Summer Westerlies, Winter Easterlies
+def Southern_Wind(x, start_coor): #Wind Direction Flow
+    return -0.176 * (x - (start_coor[0])) + start_coor[1]
+
+
+FLOWS = {flow.__name__: flow for flow in (North_Fan_Line, Central_Fan_Line, Central_Fan_Line2, North_Summer,
+                                          North_Winter, central_summer_1, central_summer_2, central_winter_1,
+                                          Southern_Wind)}
+
+
+def _wind_releases(flow, starts, speed, direction):
+    # Releases whose flow line passes through their own starting point
+    return [Release(flow, (start,), start, speed, direction) for start in starts]
+
+
+Starting_Coord_Northern_Winter = [(-0.238, -0.3), (-0.44, -0.35), (-0.565, -0.43),(-0.73, -1.18), (-0.62, -0.95), (-0.544, -0.91)]
+
+Starting_Coord_Central_Summer = [(-0.45, -0.31), (-0.178, -0.5) ,(-0.21, -0.7), (-0.124, -0.49), (-0.31, -0.65), (-0.292, -0.94), (-0.35, -1),
+                                 (-0.67, -0.955), (-0.56, -0.91), (-0.54, -0.86), (-0.064, -1.04), (-0.855, -0.69), (-0.85, -0.54), (-0.598, -0.31), (-0.785, -0.797),
+                                 (-0.04, -0.9), (-0.07, -0.74)]
+
+Starting_Coord_Central_Winter = [(-0.035, -0.002), (-0.0853, -0.482), (-0.046, -0.68), (-0.074, -0.977), (-0.45, -0.9), (-0.74, -0.94),
+                                 (-0.689, -0.78), (-0.609, -0.776), (-0.2, -0.71), (-0.905, -0.334), (-0.422, -0.32), (-0.86, -0.49), (-0.83, -0.72)]
+
+Starting_Coord_South_Summer = [(-0.85, -0.186),(-0.82, -0.12),(-0.67, -0.355) , (-0.268, -0.392), (-0.24, -0.225), (-0.66, -0.093)]
+
+Starting_Coord_South_Winter = [(-0.05, -0.145),(-0.145, -0.277) , (-0.178, -0.468), (-0.56, -0.372), (-0.43, -0.124) , (-0.719, -0.328)]
+
+Central_Upstream_Coord = [(-0.16, -0.24), (-0.11, -0.26)]
+
+
+SCENARIOS = {
+    ("Northern Howe Sound", "Summer"): Scenario(
+        shapefile=f'{SHAPEFILE_DIR}/Northern_Howe_Sound.shp',
+        label="Northern Howe Sound Summer",
+        wind_rose="Wind_Rose/North Summer.png",
+        wind_rose_daytime="Wind_Rose/North Summer Daytime.png",
+        releases=[Release('North_Fan_Line', (i,), (-0.18, -0.3), 0.8, "RtoL") for i in [10, 1.3, 0.6, -0.27]]
+                 + _wind_releases('North_Summer', [(-0.8, -1.6), (-0.66, -1.46)], 0.4, "RtoL"),
+        seed=('North_Summer', 0.4, "RtoL"),
+    ),
+    ("Northern Howe Sound", "Winter"): Scenario(
+        shapefile=f'{SHAPEFILE_DIR}/Northern_Howe_Sound.shp',
+        label="Northern Howe Sound Winter",
+        wind_rose="Wind_Rose/North Winter.png",
+        wind_rose_daytime="Wind_Rose/North Winter Daytime.png",
+        releases=_wind_releases('North_Winter', Starting_Coord_Northern_Winter, 0.15, "LtoR"),
+        seed=('North_Winter', 0.15, "LtoR"),
+    ),
+    ("Central Howe Sound", "Summer"): Scenario(
+        shapefile=f'{SHAPEFILE_DIR}/Central_Howe_Sound.shp',
+        label="Central Howe Sound Summer",
+        wind_rose="Wind_Rose/Central Summer.png",
+        wind_rose_daytime="Wind_Rose/Central Summer Daytime.png",
+        releases=_wind_releases('central_summer_1', Starting_Coord_Central_Summer, 0.4, "RtoL")
+                 + _wind_releases('central_summer_2', Central_Upstream_Coord, 0.3, "RtoL")
+                 + [Release('Central_Fan_Line', (14, v_offset), (-0.07, 0.037), 0.35, "RtoL") for v_offset in [0, 0.245, 0.292, 0.14]],
+        seed=('central_summer_1', 0.4, "RtoL"),
+    ),
+    ("Central Howe Sound", "Winter"): Scenario(
+        shapefile=f'{SHAPEFILE_DIR}/Central_Howe_Sound.shp',
+        label="Central Howe Sound Winter",
+        wind_rose="Wind_Rose/Central Winter.png",
+        wind_rose_daytime="Wind_Rose/Central Winter Daytime.png",
+        releases=_wind_releases('central_winter_1', Starting_Coord_Central_Winter, 0.1, "LtoR")
+                 + _wind_releases('central_summer_2', Central_Upstream_Coord, 0.3, "RtoL"),
+        seed=('central_winter_1', 0.1, "LtoR"),
+    ),
+    ("Southern Howe Sound", "Summer"): Scenario(
+        shapefile=f'{SHAPEFILE_DIR}/Southern_Howe_Sound.shp',
+        label="South Howe Sound Summer",
+        wind_rose="Wind_Rose/South Summer.png",
+        wind_rose_daytime="Wind_Rose/South Summer Daytime.png",
+        releases=_wind_releases('Southern_Wind', Starting_Coord_South_Summer, 0.3, "LtoR"),
+        seed=('Southern_Wind', 0.3, "LtoR"),
+    ),
+    ("Southern Howe Sound", "Winter"): Scenario(
+        shapefile=f'{SHAPEFILE_DIR}/Southern_Howe_Sound.shp',
+        label="South Howe Sound Winter",
+        wind_rose="Wind_Rose/South Winter.png",
+        wind_rose_daytime="Wind_Rose/South Winter Daytime.png",
+        releases=_wind_releases('Southern_Wind', Starting_Coord_South_Winter, 0.3, "RtoL"),
+        seed=('Southern_Wind', 0.3, "RtoL"),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def load_region(shapefile_path):
+    """
+    Read a regional shapefile and normalise it to the simulator's map coordinates.
+
+    The result is cached per path, so its spatial index is only built once per session.
+    """
+    shapefile = gpd.read_file(shapefile_path)
+    shapefile['geometry'] = shapefile['geometry'].translate(xoff=-shapefile.total_bounds[2], yoff=-shapefile.total_bounds[3])
+    shapefile['geometry'] = shapefile['geometry'].scale(xfact=-1 /shapefile.total_bounds[0], yfact=-1 /shapefile.total_bounds[0], origin=(0, 0))
+    return shapefile
+
+
+def trajectory(release, length=PATH_LENGTH):
+    """
+    Generate the path of one release.
+
+    Returns:
+        np.ndarray: (length, 2) array of x, y points.
+    """
+    if release.direction == "RtoL":
+        dir_factor = -1
+    else:
+        dir_factor = 1
+
+    x_start = release.start[0]
+    x_values = np.linspace(x_start, x_start + (dir_factor * release.speed), length)
+    y_values = np.asarray(FLOWS[release.flow](x_values, *release.args), dtype=float)
+    return np.column_stack([x_values, y_values])
+
+
+def first_hit_frames(shapefile, paths):
+    """
+    Find the animation frame at which each path first touches the coastline.
+
+    All segments of all paths are tested against the shapefile's spatial index in one query.
+    Segment i is the last one drawn once frame i + 2 is reached; paths that never reach the
+    shore get a frame past their last one.
+
+    Parameters:
+        shapefile (GeoDataFrame): Region from load_region.
+        paths (np.ndarray): (n_paths, length, 2) array of trajectories.
+    """
+    n_paths, length = paths.shape[:2]
+    segments = np.stack([paths[:, :-1], paths[:, 1:]], axis=2).reshape(-1, 2, 2)
+    segment_idx, _ = shapefile.sindex.query(shapely.linestrings(segments), predicate='intersects')
+
+    hit_frames = np.full(n_paths, length, dtype=int)
+    path_idx, segment_in_path = np.divmod(segment_idx, length - 1)
+    np.minimum.at(hit_frames, path_idx, segment_in_path + 2)
+    return hit_frames
+
+
+def stranding_points(paths, hit_frames):
+    # Head of each trail when it froze against the shore
+    stranded = hit_frames < paths.shape[1]
+    return paths[stranded, hit_frames[stranded] - 1]
+
+
+def hotspot_grid(strandings, bounds, bins=HOTSPOT_BINS):
+    """
+    Count stranding points on a regular grid over the region.
+
+    Parameters:
+        strandings (np.ndarray): (n, 2) stranding points.
+        bounds (tuple): (minx, miny, maxx, maxy) of the region.
+        bins (int): Number of cells along each axis.
+
+    Returns:
+        np.ndarray: (bins, bins) counts, rows running from miny to maxy.
+    """
+    minx, miny, maxx, maxy = bounds
+    grid, _, _ = np.histogram2d(strandings[:, 1], strandings[:, 0], bins=bins, range=[[miny, maxy], [minx, maxx]])
+    return grid
+
+
+def scenario_result(shapefile, paths, hit_frames, bins=HOTSPOT_BINS):
+    # Bundle computed trajectories with their stranding points and hotspot grid
+    strandings = stranding_points(paths, hit_frames)
+    return {'paths': paths, 'hit_frames': hit_frames, 'strandings': strandings,
+            'hotspots': hotspot_grid(strandings, shapefile.total_bounds, bins)}
+
+
+def run_scenario(scenario, length=PATH_LENGTH, bins=HOTSPOT_BINS):
+    """
+    Compute every release of a scenario without animating it.
+
+    Returns:
+        dict: paths (n_paths, length, 2), hit_frames (n_paths,), strandings (n_hits, 2)
+        and hotspots (bins, bins).
+    """
+    shapefile = load_region(scenario.shapefile)
+    paths = np.stack([trajectory(release, length) for release in scenario.releases])
+    return scenario_result(shapefile, paths, first_hit_frames(shapefile, paths), bins)
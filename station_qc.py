@@ -0,0 +1,263 @@
+"""
+Streaming quality control and gap filling for the hourly station climate CSVs.
+
+Files are the monthly downloads of Request Data.py, named climate_data_{station}_{year}_{month}.csv.
+Each station-month is read in chunks and reduced into fixed-size hourly accumulators, so memory
+stays the same however many station-years are processed. Every hour gets a status:
+
+    MISSING  no usable observation, including months whose download failed
+    OK       valid wind direction (and speed, when reported)
+    CALM     zero wind speed or direction code 0
+    OUTLIER  direction outside 1-36 tens of degrees or speed outside 0-MAX_WIND_SPEED;
+             variable-direction codes fall outside 1-36 and are classed here
+    FILLED   short MISSING/OUTLIER run between two OK hours, interpolated
+
+Gaps of up to MAX_FILL_HOURS are filled within a station-month: direction by interpolating its
+unit vector (so 350 and 10 degrees give 360, not 180) and speed linearly. Filled hours are not
+observations and do not count towards coverage.
+"""
+import argparse
+import calendar
+import os
+import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+TIME_COL = "Date/Time (LST)"
+WIND_DIR_COL = "Wind Dir (10s deg)"
+WIND_SPD_COL = "Wind Spd (km/h)"
+CHUNK_ROWS = 10000
+MAX_WIND_SPEED = 150  # km/h, anything above is treated as an outlier
+MAX_FILL_HOURS = 3  # Longest gap filled by interpolation
+
+MISSING, OK, CALM, OUTLIER, FILLED = range(5)
+STATUS_NAMES = ['missing', 'ok', 'calm', 'outlier', 'filled']
+
+FILE_PATTERN = re.compile(r"climate_data_(\d+)_(\d{4})_(\d{1,2})\.csv$")
+
+# Cleaned hourly arrays of one station-month; direction in degrees (0, 360], NaN unless status is OK or FILLED
+MonthQC = namedtuple('MonthQC', ['station', 'year', 'month', 'time', 'direction', 'speed', 'status'])
+
+
+def station_files(folder_path):
+    """Map (station, year, month) to the CSV path of every monthly download in a folder."""
+    files = {}
+    for filename in os.listdir(folder_path):
+        match = FILE_PATTERN.match(filename)
+        if match:
+            station, year, month = map(int, match.groups())
+            files[(station, year, month)] = os.path.join(folder_path, filename)
+    return files
+
+
+def _to_direction(u, v):
+    # Unit vector back to degrees in (0, 360], the station convention with north as 360
+    direction = np.round(np.degrees(np.arctan2(u, v)), 6)
+    return np.where(direction <= 0, direction + 360, direction)
+
+
+def fill_gaps(direction, speed, status, max_hours=MAX_FILL_HOURS):
+    """
+    Interpolate short MISSING/OUTLIER runs bounded by OK hours on both sides, in place.
+
+    Runs next to a CALM hour or the month edge are left as they are.
+    """
+    n_hours = len(status)
+    hour = np.arange(n_hours)
+    known = (status == OK) | (status == CALM)
+    if np.count_nonzero(status == OK) < 2:
+        return
+
+    # Nearest known hour before and after every hour
+    prev_known = np.maximum.accumulate(np.where(known, hour, -1))
+    next_known = np.minimum.accumulate(np.where(known, hour, n_hours)[::-1])[::-1]
+    bounded = (prev_known >= 0) & (next_known < n_hours)
+    prev_ok = status[np.clip(prev_known, 0, n_hours - 1)] == OK
+    next_ok = status[np.clip(next_known, 0, n_hours - 1)] == OK
+    fill = ~known & bounded & prev_ok & next_ok & (next_known - prev_known - 1 <= max_hours)
+    if not fill.any():
+        return
+
+    ok = status == OK
+    theta = np.radians(direction[ok])
+    u = np.interp(hour[fill], hour[ok], np.sin(theta))
+    v = np.interp(hour[fill], hour[ok], np.cos(theta))
+    direction[fill] = _to_direction(u, v)
+
+    has_speed = ok & ~np.isnan(speed)
+    if has_speed.any():
+        speed[fill] = np.interp(hour[fill], hour[has_speed], speed[has_speed])
+    status[fill] = FILLED
+
+
+def clean_month(file_path, station, year, month, chunksize=CHUNK_ROWS, fill_hours=MAX_FILL_HOURS):
+    """
+    Quality-control one station-month and resample it onto a complete hourly grid.
+
+    Several observations in the same hour are averaged, the direction as a unit vector mean.
+    Gaps of up to fill_hours are then filled (see fill_gaps); a missing file gives a month
+    of MISSING hours. Raises ValueError when the file is not a readable station CSV.
+    """
+    n_hours = calendar.monthrange(year, month)[1] * 24
+    month_start = pd.Timestamp(year=year, month=month, day=1)
+
+    # Fixed-size hourly accumulators, filled chunk by chunk
+    u_sum = np.zeros(n_hours)
+    v_sum = np.zeros(n_hours)
+    dir_count = np.zeros(n_hours)
+    spd_sum = np.zeros(n_hours)
+    spd_count = np.zeros(n_hours)
+    calm_count = np.zeros(n_hours)
+    outlier_count = np.zeros(n_hours)
+
+    if file_path is not None:
+        for chunk in pd.read_csv(file_path, usecols=[TIME_COL, WIND_DIR_COL, WIND_SPD_COL], chunksize=chunksize):
+            # Rows with a blank or unreadable timestamp cannot be placed on the grid and are dropped
+            time = pd.to_datetime(chunk[TIME_COL], format="%Y-%m-%d %H:%M", errors='coerce')
+            has_time = time.notna().to_numpy()
+            hour = ((time[has_time] - month_start) // pd.Timedelta(hours=1)).to_numpy(dtype=np.int64)
+            direction = chunk[WIND_DIR_COL].to_numpy(dtype=float)[has_time]
+            speed = chunk[WIND_SPD_COL].to_numpy(dtype=float)[has_time]
+
+            in_month = (hour >= 0) & (hour < n_hours)
+            hour, direction, speed = hour[in_month], direction[in_month], speed[in_month]
+
+            calm = (speed == 0) | (direction == 0)
+            bad_speed = (speed < 0) | (speed > MAX_WIND_SPEED)
+            bad_direction = ~np.isnan(direction) & ((direction < 1) | (direction > 36))
+            outlier = ~calm & (bad_speed | bad_direction)
+            valid = ~calm & ~outlier & ~np.isnan(direction)
+
+            theta = np.radians(direction[valid] * 10)
+            np.add.at(u_sum, hour[valid], np.sin(theta))
+            np.add.at(v_sum, hour[valid], np.cos(theta))
+            np.add.at(dir_count, hour[valid], 1)
+            has_speed = valid & ~np.isnan(speed)
+            np.add.at(spd_sum, hour[has_speed], speed[has_speed])
+            np.add.at(spd_count, hour[has_speed], 1)
+            np.add.at(calm_count, hour[calm], 1)
+            np.add.at(outlier_count, hour[outlier], 1)
+
+    status = np.full(n_hours, MISSING, dtype=np.int8)
+    status[outlier_count > 0] = OUTLIER
+    status[calm_count > 0] = CALM
+    status[dir_count > 0] = OK
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        direction = _to_direction(u_sum, v_sum)
+        direction[status != OK] = np.nan
+        speed = spd_sum / spd_count
+    speed[status == CALM] = 0
+    fill_gaps(direction, speed, status, fill_hours)
+
+    time = pd.date_range(month_start, periods=n_hours, freq='h')
+    return MonthQC(station, year, month, time, direction, speed, status)
+
+
+class CoverageReport:
+    def __init__(self):
+        # Per station: hours counted by status, month of year and hour of day
+        self.counts = {}
+        self.gaps = []  # (station, year, month) whose file is missing or unreadable
+        self.errors = {}  # (station, year, month) -> why its file could not be read
+
+    def add(self, month_qc, gap=False, error=None):
+        counts = self.counts.setdefault(month_qc.station, np.zeros((len(STATUS_NAMES), 12, 24), dtype=np.int64))
+        hour_of_day = np.arange(len(month_qc.status)) % 24
+        np.add.at(counts, (month_qc.status, month_qc.month - 1, hour_of_day), 1)
+        if gap or error is not None:
+            self.gaps.append((month_qc.station, month_qc.year, month_qc.month))
+        if error is not None:
+            self.errors[(month_qc.station, month_qc.year, month_qc.month)] = error
+
+    def coverage(self):
+        """
+        Hour counts for each station, month and hour of day.
+
+        Returns:
+            DataFrame: One row per station/month/hour with a column per status and
+            'coverage', the share of hours with an OK or CALM observation.
+        """
+        rows = []
+        for station, counts in sorted(self.counts.items()):
+            month, hour = np.meshgrid(np.arange(1, 13), np.arange(24), indexing='ij')
+            frame = pd.DataFrame({'station': station, 'month': month.ravel(), 'hour': hour.ravel()})
+            for status, name in enumerate(STATUS_NAMES):
+                frame[name] = counts[status].ravel()
+            rows.append(frame)
+        if not rows:
+            return pd.DataFrame(columns=['station', 'month', 'hour', *STATUS_NAMES, 'coverage'])
+
+        table = pd.concat(rows, ignore_index=True)
+        total = table[STATUS_NAMES].sum(axis=1)
+        table['coverage'] = (table['ok'] + table['calm']) / total.where(total > 0)
+        return table
+
+
+def clean_station_months(folder_path, months=None, start_year=None, end_year=None, report=None,
+                         chunksize=CHUNK_ROWS, fill_hours=MAX_FILL_HOURS):
+    """
+    Stream the cleaned hourly arrays of every station-month in a folder.
+
+    Parameters:
+        folder_path (str): Folder with the monthly station CSVs.
+        months (set): Months of year to keep, all by default.
+        start_year, end_year (int): Expected range; defaults to the years found for each station.
+            Months in range without a file, or whose file cannot be read (such as an error page
+            saved by a failed download), are reported as gaps and yielded as MISSING.
+        report (CoverageReport): Optional report updated with every month.
+        fill_hours (int): Longest gap filled by interpolation, 0 to disable.
+
+    Yields:
+        MonthQC: One station-month at a time, in station, year, month order.
+    """
+    files = station_files(folder_path)
+    for station in sorted({key[0] for key in files}):
+        years = [key[1] for key in files if key[0] == station]
+        first_year = start_year if start_year is not None else min(years)
+        last_year = end_year if end_year is not None else max(years)
+
+        for year in range(first_year, last_year + 1):
+            for month in range(1, 13):
+                if months is not None and month not in months:
+                    continue
+                file_path = files.get((station, year, month))
+                error = None
+                try:
+                    month_qc = clean_month(file_path, station, year, month, chunksize, fill_hours)
+                except (OSError, ValueError) as exc:  # Parser, decode and missing-column errors are ValueErrors
+                    error = f"{os.path.basename(file_path)}: {exc}"
+                    month_qc = clean_month(None, station, year, month, chunksize, fill_hours)
+                if report is not None:
+                    report.add(month_qc, gap=file_path is None, error=error)
+                yield month_qc
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Quality-control hourly station climate CSVs.")
+    parser.add_argument('folder', help="Folder with climate_data_{station}_{year}_{month}.csv files")
+    parser.add_argument('--start-year', type=int)
+    parser.add_argument('--end-year', type=int)
+    parser.add_argument('--coverage-csv', help="Write station/month/hour coverage to this CSV file")
+    parser.add_argument('--hourly-dir', help="Write the cleaned hourly arrays of each station-month as .npz here")
+    args = parser.parse_args()
+
+    report = CoverageReport()
+    if args.hourly_dir:
+        os.makedirs(args.hourly_dir, exist_ok=True)
+    for month_qc in clean_station_months(args.folder, start_year=args.start_year, end_year=args.end_year,
+                                         report=report):
+        if args.hourly_dir:
+            np.savez(os.path.join(args.hourly_dir, f"hourly_{month_qc.station}_{month_qc.year}_{month_qc.month:02d}.npz"),
+                     time=month_qc.time.to_numpy(), direction=month_qc.direction, speed=month_qc.speed,
+                     status=month_qc.status)
+
+    for station, year, month in report.gaps:
+        error = report.errors.get((station, year, month))
+        print(f"Missing data for station {station} {year}-{month:02d}" + (f" (unreadable {error})" if error else ""))
+    coverage = report.coverage()
+    print(coverage.groupby(['station', 'month'])[STATUS_NAMES].sum().to_string())
+    if args.coverage_csv:
+        coverage.to_csv(args.coverage_csv, index=False)
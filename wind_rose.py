@@ -1,48 +1,36 @@
-import os
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from station_qc import OK, CoverageReport, clean_station_months
 
 folder_path = "C:/Users/zhangtyl.stu/OneDrive - UBC/Desktop/North"
 
 months = {6,7,8} #summer
 #months = {12,1,2}    #winter
 
-wind_directions = []
-
-for filename in os.listdir(folder_path):
-    if filename.endswith(".csv"):
-        parts = filename.split("_")
-        month = int(parts[-1].split(".")[0])
-
-        if month in months:
-            file_path = os.path.join(folder_path, filename)
-            df = pd.read_csv(file_path)
-
-
-            #This section is for Seperating Day and Night
-            df["Time (LST)"] = pd.to_datetime(df["Time (LST)"], format="%H:%M")
-            df["Hour"] = df["Time (LST)"].dt.hour  # Extract the hour
-
-            #df = df[(df["Hour"] < 7) | (df["Hour"] > 22)]     #night
-            df = df[(df["Hour"] >= 9) & (df["Hour"] <= 19)]    #daytime
-
-
+num_bins = 36  # 36bins, 10 degrees per bin
+bin_edges = np.linspace(0, 2 * np.pi, num_bins + 1)
+hist = np.zeros(num_bins, dtype=int)
 
-            wind_dir_col = "Wind Dir (10s deg)"
-            valid_wind_data = df[wind_dir_col].dropna().tolist()  # Remove NaN values
-            wind_directions.extend(valid_wind_data)
+report = CoverageReport()
 
+# Cleaned hourly data one station-month at a time; gaps, calms and outliers are left out of the rose
+for month_qc in clean_station_months(folder_path, months=months, report=report):
 
-wind_directions = [x * 10 for x in wind_directions]
+    #This section is for Seperating Day and Night
+    hours = month_qc.time.hour.to_numpy()
 
+    #daytime = (hours < 7) | (hours > 22)     #night
+    daytime = (hours >= 9) & (hours <= 19)    #daytime
 
-wind_directions_radians = np.radians(wind_directions)
+    valid_wind_data = month_qc.direction[(month_qc.status == OK) & daytime]
+    hist += np.histogram(np.radians(valid_wind_data), bins=bin_edges)[0] # Count occurrences in each bin
 
-num_bins = 36  # 36bins, 10 degrees per bin
-bin_edges = np.linspace(0, 2 * np.pi, num_bins + 1)
 
-hist, _ = np.histogram(wind_directions_radians, bins=bin_edges) # Count occurrences in each bin
+for station, year, month in report.gaps:
+    error = report.errors.get((station, year, month))
+    print(f"Missing data for station {station} {year}-{month:02d}" + (f" (unreadable {error})" if error else ""))
+coverage = report.coverage()
+print(coverage.groupby(['station', 'month'])[['ok', 'calm', 'filled', 'outlier', 'missing']].sum().to_string())
 
 # Find the top two highest frequency bins
 top_two_indices = np.argsort(hist)[-2:][::-1]  # Get indices of two highest counts in descending order